@@ -2,44 +2,102 @@ import re
 from bnlp import BengaliCorpus as corpus
 
 
+# Compile the cleaning patterns once at import time
+_DIGIT_RE = re.compile(r"[০-৯0-9]+")
+_ENSPEC_RE = re.compile(r'[a-zA-Z!@#$%^&*()_+{}:;"\'<>,.?~\/-]+')
+# Unicode ranges for emojis
+_EMOJI_RANGES = [
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F680, 0x1F6FF),  # transport & map symbols
+    (0x1F700, 0x1F77F),  # alchemical symbols
+    (0x1F780, 0x1F7FF),  # Geometric Shapes
+    (0x1F800, 0x1F8FF),  # Supplemental Arrows-C
+    (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
+    (0x1FA00, 0x1FA6F),  # Chess Symbols
+    (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
+    (0x2702, 0x27B0),  # Dingbats
+    (0x24C2, 0x1F251),
+]
+
+
+def _merge_ranges(ranges):
+    # Overlapping or adjacent ranges are merged, as every range in a
+    # character class is tested in turn for each character
+    merged = []
+    for low, high in sorted(ranges):
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], high)
+        else:
+            merged.append([low, high])
+    return merged
+
+
+_EMOJI_RE = re.compile(
+    "["
+    + "".join(
+        f"{re.escape(chr(low))}-{re.escape(chr(high))}"
+        for low, high in _merge_ranges(_EMOJI_RANGES)
+    )
+    + "]+"
+)
+# Digits, english/special characters and emojis removed in a single scan
+_ALL_RE = re.compile(
+    "|".join(pattern.pattern for pattern in (_DIGIT_RE, _ENSPEC_RE, _EMOJI_RE))
+)
+
+
 # Define the CleanText class
 class TextCleaner:
     def __init__(self):
         punc = corpus.punctuations + ("‘") + ("’")
         self.PUNCTUATIONS = set(punc)
-        self.STOPWORDS = set(corpus.stopwords)
+        self._punc_re = re.compile(
+            "[" + "".join(map(re.escape, sorted(self.PUNCTUATIONS))) + "]"
+        )
+        self.STOPWORDS = frozenset(corpus.stopwords)
+        # Bangla has no letter case, so lowercasing words is only needed
+        # when some stopword contains cased (e.g. Latin) characters
+        self._has_cased_stopwords = any(
+            word.lower() != word.upper() for word in self.STOPWORDS
+        )
+        self._emoji_sub = _EMOJI_RE.sub
+        self.CLEAN_ALL_PATTERN = _ALL_RE.pattern
 
     def remove_digits(self, text):
-        return re.sub(r"[০-৯]+\d+", "", text).strip()
+        if not text:
+            return ""
+        return _DIGIT_RE.sub("", text).strip()
 
     def remove_punctuations(self, text, replace_with=" "):
-        for punc in self.PUNCTUATIONS:
-            text = text.replace(punc, replace_with)
+        if not text:
+            return ""
+        # Escape backslashes so replace_with is inserted literally
+        text = self._punc_re.sub(replace_with.replace("\\", "\\\\"), text)
         return " ".join(text.split())
 
     def remove_stopwords(self, text):
+        if not text:
+            return ""
+        stopwords = self.STOPWORDS
         words = text.split()
-        new_text = [word for word in words if word.lower() not in self.STOPWORDS]
+        if self._has_cased_stopwords:
+            new_text = [word for word in words if word.lower() not in stopwords]
+        else:
+            new_text = [word for word in words if word not in stopwords]
         return " ".join(new_text)
 
     def remove_english_and_special_chars(self, text):
-        return re.sub(r'[a-zA-Z0-9!@#$%^&*()_+{}:;"\'<>,.?~\/-]+', "", text)
+        if not text:
+            return ""
+        return _ENSPEC_RE.sub("", text)
     
     def remove_emojis(self, text):
-        # Unicode ranges for emojis
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F700-\U0001F77F"  # alchemical symbols
-            "\U0001F780-\U0001F7FF"  # Geometric Shapes
-            "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
-            "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-            "\U0001FA00-\U0001FA6F"  # Chess Symbols
-            "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-            "\U00002702-\U000027B0"  # Dingbats
-            "\U000024C2-\U0001F251" 
-            "]+", flags=re.UNICODE
-        )
-        return emoji_pattern.sub(r'', text)
+        if not text:
+            return ""
+        return self._emoji_sub(r'', text)
+
+    def clean_all(self, text):
+        if not text:
+            return ""
+        return _ALL_RE.sub("", text)